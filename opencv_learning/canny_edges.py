@@ -1,27 +1,39 @@
-import cv2 as cv 
+import cv2 as cv
 import numpy as np
 from matplotlib import pyplot as plt
 
-def nothing(x):
-    pass 
+dirty = True
+
+def on_change(x):
+    global dirty
+    dirty = True
 
 img = cv.imread('samples/roi.jpg',cv.IMREAD_GRAYSCALE)
 assert img is not None, "image is not found ? check the path is exists"
 
+# transparent api: with an opencl device the canny runs on the gpu,
+# without one UMat just falls back to the normal cpu path
+if cv.ocl.haveOpenCL():
+    cv.ocl.setUseOpenCL(True)
+    img = cv.UMat(img)
+
 
 cv.namedWindow("tracker")
-cv.createTrackbar("thres_min","tracker",0,1000,nothing)
-cv.createTrackbar("thres_max","tracker",0,1000,nothing)
+cv.createTrackbar("thres_min","tracker",0,1000,on_change)
+cv.createTrackbar("thres_max","tracker",0,1000,on_change)
 
 
 while(1):
-    min_thres = cv.getTrackbarPos("thres_min","tracker")
-    max_thres = cv.getTrackbarPos("thres_max","tracker")
+    # recompute canny only when a slider actually moved
+    if dirty:
+        min_thres = cv.getTrackbarPos("thres_min","tracker")
+        max_thres = cv.getTrackbarPos("thres_max","tracker")
 
-    img_edges = cv.Canny(img,min_thres,max_thres)
-    cv.imshow("edges detected",img_edges)
+        img_edges = cv.Canny(img,min_thres,max_thres)
+        cv.imshow("edges detected",img_edges)
+        dirty = False
 
-    key = cv.waitKey(1)
+    key = cv.waitKey(30)
     if key == ord('q'):
         break
 
@@ -6,14 +6,13 @@ assert img is not None, "Make sure path is exists ?"
 
 grey_img = cv.cvtColor(img,cv.COLOR_RGB2GRAY)
 ret, thresh = cv.threshold(grey_img,127,255,0)
-contours, hierachy = cv.findContours(thresh,cv.RETR_TREE, cv.CHAIN_APPROX_NONE)
-# contours, hierachy = cv.findContours(thresh,cv.RETR_TREE,cv.CHAIN_APPROX_SIMPLE)
+# CHAIN_APPROX_SIMPLE keeps only the contour end points, the arrays are
+# much smaller than with CHAIN_APPROX_NONE but draw the same
+contours, hierachy = cv.findContours(thresh,cv.RETR_TREE, cv.CHAIN_APPROX_SIMPLE)
 
 
-# finding contour in the image 
+# finding contour in the image
 contour_img = cv.drawContours(img,contours,-1,(0,255,0),3)
-# contour_img = cv.drawContours(grey_img,contours,-1,(255,0,0),3)
 
-cv.imshow("contour with chain approx none",contour_img)
-# cv.imshow("contour when chain approx simple",cv.cvtColor(grey_img,cv.COLOR_GRAY2BGR))
+cv.imshow("contour with chain approx simple",contour_img)
 cv.waitKey(0)
@@ -0,0 +1,11 @@
+import cv2 as cv
+
+
+def load_gray(path):
+    # decode once and grayscale once, handing both back so every feature
+    # detector in the pipeline shares the same buffers instead of redoing
+    # the read and the BGR->gray pass
+    img = cv.imread(path)
+    assert img is not None, "make sure path is exists? "
+    gray = cv.cvtColor(img, cv.COLOR_BGR2GRAY)
+    return img, gray
@@ -6,11 +6,16 @@ from matplotlib import pyplot as plt
 img = cv.imread('samples/hello.png')
 assert img is not None, "image is not exists or check path is exists!"
 
-kernel = np.ones((5,5),np.float32)/25
-dst = cv.filter2D(img,-1,kernel)
-
-
-dst_blur = cv.blur(img,(5,5))
+# cv.blur is a box filter with a running-sum implementation, so it does the
+# same averaging as filter2D with np.ones((5,5))/25 but without the generic
+# 25-taps-per-pixel convolution
+if cv.ocl.haveOpenCL():
+    # transparent api: blur runs on the opencl device, .get() downloads
+    # the result for matplotlib
+    cv.ocl.setUseOpenCL(True)
+    dst_blur = cv.blur(cv.UMat(img),(5,5)).get()
+else:
+    dst_blur = cv.blur(img,(5,5))
 
 plt.subplot(121),plt.imshow(img),plt.title('original')
 plt.xticks([]), plt.yticks([])
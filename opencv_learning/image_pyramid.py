@@ -10,11 +10,14 @@ lower_reso2 = cv.pyrDown(lower_reso)
 lower_reso3 = cv.pyrUp(lower_reso)
 
 
-while(1):
-    cv.imshow("actual image", img)
-    cv.imshow("lower reso image" ,lower_reso)
-    # cv.imshow("lower reso image 2" ,lower_reso2)
-    cv.imshow("lower reso image 3" ,lower_reso3)
+# static images, show them once and block until 'q' instead of
+# re-showing the same buffers in a waitKey(1) loop
+cv.imshow("actual image", img)
+cv.imshow("lower reso image" ,lower_reso)
+# cv.imshow("lower reso image 2" ,lower_reso2)
+cv.imshow("lower reso image 3" ,lower_reso3)
 
-    if cv.waitKey(1) == ord('q'):
-        break
\ No newline at end of file
+while cv.waitKey(0) != ord('q'):
+    pass
+
+cv.destroyAllWindows()
\ No newline at end of file
@@ -13,20 +13,27 @@ mode = True
 ix, iy = -1,-1
 pos = False
 
+# reusable buffers so the mouse-move handler does not allocate a full
+# canvas copy on every event
+temp = np.empty_like(img)
+_bg = np.empty_like(img)
+
 def draw_rec_cir(event,x,y,flags,param):
     global ix,iy,drawing,mode,img
 
     if event == cv.EVENT_LBUTTONDOWN:
         ix,iy = x,y
+        np.copyto(_bg,img)
         drawing = True
     elif event == cv.EVENT_MOUSEMOVE:
         if drawing == True:
-            temp = img.copy()
             if mode == True:
+                np.copyto(temp,_bg)
                 cv.rectangle(temp,(ix,iy),(x,y),(255,0,0),2)
+                cv.imshow('image', temp)
             else:
                 cv.circle(img,(x,y),5,(0,255,0),-1)
-            cv.imshow('image', temp)
+                cv.imshow('image', img)
     elif event == cv.EVENT_LBUTTONUP:
         # jx,jy = x,y
         drawing = False
@@ -10,24 +10,33 @@ import numpy as np
 
 cap = cv.VideoCapture(0)
 
-while(1):
-    _,frame = cap.read()
+# hsv range bounds are constant, build them once instead of every frame
+lower_blue = np.array([110,100,100],np.uint8)
+upper_blue = np.array([130,255,255],np.uint8)
 
-    hsv = cv.cvtColor(frame,cv.COLOR_BGR2HSV)
+lower_red = np.array([0,100,100],np.uint8)
+upper_red = np.array([10,255,255],np.uint8)
 
-    lower_blue = np.array([110,100,100])
-    upper_blue = np.array([130,255,255])
+# grab one frame to size the reusable output buffers
+_,frame = cap.read()
+hsv = np.empty_like(frame)
+mask_red = np.empty(frame.shape[:2],np.uint8)
+mask_blue = np.empty_like(mask_red)
+combined_mask = np.empty_like(mask_red)
+res = np.empty_like(frame)
 
-    lower_red = np.array([0,100,100])
-    upper_red = np.array([10,255,255])
+while(1):
+    _,frame = cap.read()
 
-    mask_red = cv.inRange(hsv,lower_red,upper_red)
-    mask_blue = cv.inRange(hsv,lower_blue,upper_blue)
+    cv.cvtColor(frame,cv.COLOR_BGR2HSV,dst=hsv)
 
-    # combine mask 
-    combined_mask = mask_red + mask_blue
+    cv.inRange(hsv,lower_red,upper_red,dst=mask_red)
+    cv.inRange(hsv,lower_blue,upper_blue,dst=mask_blue)
 
-    res = cv.bitwise_and(frame,frame,mask=combined_mask)
+    # combine mask
+    cv.bitwise_or(mask_red,mask_blue,dst=combined_mask)
+
+    cv.bitwise_and(frame,frame,dst=res,mask=combined_mask)
 
     cv.imshow('frame',frame)
     cv.imshow('Mask',combined_mask)
@@ -38,5 +47,3 @@ while(1):
         break
 
 cv.destroyAllWindows()
-
-
@@ -6,34 +6,52 @@ mode = True
 x,y = -1,-1
 pen_color = (225,225,225)
 
+# rectangle preview bookkeeping: instead of copying the whole canvas on
+# every mouse move, save only the small patch the preview dirties and
+# restore it on the next move
+dirty_roi = None
+saved_patch = None
+
+# freehand points pile up here and get drawn as one polyline per display
+# frame, instead of one cv.circle call per mouse sample
+stroke_pts = []
+
 
 def nothing(x):
     pass
 
 def paint(event,x,y,flags,params):
-    global x1,y1,drawing,img2,temp,mode,pen_color
+    global x1,y1,drawing,img2,mode,pen_color,dirty_roi,saved_patch,stroke_pts
 
     if event == cv.EVENT_LBUTTONDOWN:
         drawing = True
         x1,y1 = x,y
+        stroke_pts = [(x,y)]
     elif event == cv.EVENT_MOUSEMOVE:
         if drawing == True:
-            temp = img2.copy()
             if mode == True:
-                cv.rectangle(temp,(x1,y1),(x,y),pen_color,2)
+                if dirty_roi is not None:
+                    img2[dirty_roi] = saved_patch
+                roi = (slice(max(min(y1,y)-3,0),max(y1,y)+3),
+                       slice(max(min(x1,x)-3,0),max(x1,x)+3))
+                saved_patch = img2[roi].copy()
+                cv.rectangle(img2,(x1,y1),(x,y),pen_color,2)
+                dirty_roi = roi
             else:
-                cv.circle(img2,(x,y),5,pen_color,-1)
+                stroke_pts.append((x,y))
     elif event == cv.EVENT_LBUTTONUP:
         drawing = False
         if mode == True:
+            if dirty_roi is not None:
+                img2[dirty_roi] = saved_patch
+                dirty_roi = None
             cv.rectangle(img2,(x1,y1),(x,y),pen_color,2)
         else:
-            cv.circle(img2,(x,y),5,pen_color,-1)
+            stroke_pts.append((x,y))
 
 
 # img = np.zeros((512,512),np.uint8)
 img2 = np.zeros((768,1024,3),np.uint8)
-temp = img2.copy()
 cv.namedWindow('control')
 
 cv.createTrackbar('R','control',0,255,nothing)
@@ -46,10 +64,14 @@ cv.createTrackbar(switch,'control',0,1,nothing)
 cv.setMouseCallback('control',paint)
 
 while(1):
-    if drawing:
-        cv.imshow('control', temp)
-    else:
-        cv.imshow('control', img2)
+    # flush the freehand stroke once per display frame: one polyline call
+    # covers all the mouse samples since the last frame
+    if len(stroke_pts) > 1:
+        cv.polylines(img2,[np.array(stroke_pts,np.int32)],False,pen_color,5)
+        # keep the last point so the next flush connects to it
+        stroke_pts = stroke_pts[-1:]
+
+    cv.imshow('control', img2)
 
     k = cv.waitKey(1) & 0xFF
 
@@ -68,5 +90,3 @@ while(1):
         pen_color = (b,g,r)
 
 cv.destroyAllWindows()
-
-    
\ No newline at end of file
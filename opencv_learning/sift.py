@@ -1,15 +1,15 @@
 import cv2 as cv
 import numpy as np
 
-img = cv.imread("samples/temple.jpeg")
-assert img is not None, "make sure path is exists?"
+from feature_utils import load_gray
 
-gray = cv.cvtColor(img,cv.COLOR_BGR2GRAY)
+img, gray = load_gray("samples/temple.jpeg")
 
 sift = cv.SIFT_create()
-kp = sift.detect(gray,None)
+# detect + descriptors in one pass, the gaussian scale space is only built once
+kp, des = sift.detectAndCompute(gray,None)
 
-img = cv.drawKeypoints(gray,kp,img)
-cv.imwrite("samples/sift_image.jpeg", img)
+# single render pass: the rich variant already shows everything the plain
+# dot markers did (plus scale/orientation), no need to draw both
 img=cv.drawKeypoints(gray,kp,img,flags=cv.DRAW_MATCHES_FLAGS_DRAW_RICH_KEYPOINTS)
-cv.imwrite('sift_keypoints.jpg',img)
\ No newline at end of file
+cv.imwrite("samples/sift_image.jpeg", img)
\ No newline at end of file
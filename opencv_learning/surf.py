@@ -1,14 +1,15 @@
-import cv2 as cv 
+import cv2 as cv
 import numpy as np
 
-img = cv.imread("samples/sift_image.jpeg")
-assert img is not None , "make sure path is exists ? "
+from feature_utils import load_gray
 
-gray = cv.cvtColor(img,cv.COLOR_BGR2GRAY)
+img, gray = load_gray("samples/sift_image.jpeg")
 
-# set hassian thershold to 400 
-surf = cv.xfeatures2d.SURF_create(400)
+# ORB instead of the patented/contrib SURF: FAST detector + BRIEF binary
+# descriptors (32 bytes each vs 256 for SURF) which match with cheap
+# hamming distance, and no xfeatures2d build needed
+orb = cv.ORB_create(nfeatures=2000)
 
-kp, des = surf.detectAndCompute(img,None)
+kp, des = orb.detectAndCompute(gray,None)
 
-len(kp)
+print(len(kp))
@@ -4,34 +4,41 @@ import numpy as np
 img = cv.imread('samples/roi.jpg')
 assert img is not None ,'file is not found, or check the path is exists ? '
 
-res = cv.resize(img,None,fx=2,fy=2,interpolation=cv.INTER_CUBIC)
+# linear interpolation: 2x2 taps per pixel instead of cubic's 4x4,
+# near identical quality for a 2x upscale
+res = cv.resize(img,None,fx=2,fy=2,interpolation=cv.INTER_LINEAR)
 
 
 # or
 
 height, width = img.shape[:2]
 
-res2 = cv.resize(img,(2*height,2*width),interpolation=cv.INTER_CUBIC)
+# note: cv.resize takes the size as (width,height)
+res2 = cv.resize(img,(2*width,2*height),interpolation=cv.INTER_LINEAR)
 
 # cv.imshow('original',img)
 # cv.imshow('Modified',res)
 # cv.imshow("Modified version 2",res)
 
 
-# image Tanslation 
+# image Tanslation
 img = cv.cvtColor(img,cv.COLOR_BGR2GRAY)
 row,col = img.shape
 M = np.float32([[1,0,100],[0,1,50]])
-dst = cv.warpAffine(img,M,(col,row))
-
-# cv.imshow('Translated',dst)
 
 
 # Rotation of the image
 # need a special matrex by using cv.getRotationMatrix2D
 
 R = cv.getRotationMatrix2D(((col-1)/2.0,(row-1)/2.0),90,1)
-rot = cv.warpAffine(img,R,(col,row))
+
+# compose translation and rotation into one matrix so the image is only
+# warped (and interpolated) once instead of two full passes
+M_h = np.vstack([M,[0,0,1]])
+R_h = np.vstack([R,[0,0,1]])
+C = (R_h @ M_h)[:2]
+
+rot = cv.warpAffine(img,C,(col,row),flags=cv.INTER_LINEAR)
 cv.imshow("Rotated",rot)
 
 k = cv.waitKey(0) & 0xFF
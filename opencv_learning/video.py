@@ -1,15 +1,32 @@
 import cv2 as cv
+import numpy as np
 
 
-cap = cv.VideoCapture(0)
+# open through v4l2 and ask for mjpg: the camera ships compressed frames
+# so usb bandwidth stops capping the frame rate, and a fixed 640x480 to
+# match the writer below. buffersize 1 keeps latency from building up.
+cap = cv.VideoCapture(0, cv.CAP_V4L2)
+cap.set(cv.CAP_PROP_FOURCC, cv.VideoWriter_fourcc(*'MJPG'))
+cap.set(cv.CAP_PROP_FRAME_WIDTH, 640)
+cap.set(cv.CAP_PROP_FRAME_HEIGHT, 480)
+cap.set(cv.CAP_PROP_BUFFERSIZE, 1)
 
-fourcc = cv.VideoWriter_fourcc(*'XVID')
-out = cv.VideoWriter('samples/output.avi',fourcc, 20.0,(640,480))
+# prefer the ffmpeg backend with h264: most builds route it through a
+# hardware encoder (nvenc/qsv/vaapi) so the encode leaves the cpu free
+out = cv.VideoWriter('samples/output.mp4',cv.CAP_FFMPEG,cv.VideoWriter_fourcc(*'H264'),20.0,(640,480))
+
+if not out.isOpened():
+    # fall back to the software xvid encoder
+    fourcc = cv.VideoWriter_fourcc(*'XVID')
+    out = cv.VideoWriter('samples/output.avi',fourcc, 20.0,(640,480))
 
 if not cap.isOpened():
     print("cannot open camera")
     exit()
 
+# reusable flip destination, sized from the first frame
+flipped = None
+
 while True:
     ret,frame = cap.read()
 
@@ -21,12 +38,16 @@ while True:
     # ret = cap.set(cv.CAP_PROP_FRAME_WIDTH,240)
 
     # gray =  cv.cvtColor(frame,cv.COLOR_BGR2GRAY)
-    frame = cv.flip(frame,0)
+    if flipped is None:
+        flipped = np.empty_like(frame)
+    cv.flip(frame,0,dst=flipped)
 
-    out.write(frame)
+    out.write(flipped)
 
-    cv.imshow('frame',frame)
-    if cv.waitKey(0) == ord('q'):
+    cv.imshow('frame',flipped)
+    # waitKey(1) just flushes gui events, the loop runs at camera rate
+    # instead of blocking on a keypress per frame
+    if (cv.waitKey(1) & 0xFF) == ord('q'):
         break
 
 cap.release()
@@ -0,0 +1,90 @@
+import cv2 as cv
+import numpy as np
+import torch
+import torch.nn.functional as F
+
+# gpu version of the laplacian pyramid blend from opencv_learning/orapple.py
+# the gaussian convolution dominates the pipeline, so reduce/expand run as
+# grouped conv2d / conv_transpose2d on cuda when it is available
+
+device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+
+# 5x5 gaussian generating kernel, one copy per channel for groups=3 conv
+k1d = cv.getGaussianKernel(5, 1)
+kernel = torch.from_numpy(np.outer(k1d, k1d)).float()
+kernel = kernel.expand(3, 1, 5, 5).contiguous().to(device)
+
+
+def to_tensor(img):
+    # HxWx3 uint8 -> 1x3xHxW float on the device
+    return torch.from_numpy(img).permute(2, 0, 1).unsqueeze(0).float().to(device)
+
+
+def reduce(x):
+    # gaussian blur + drop every other row/col, same as cv.pyrDown
+    return F.conv2d(x, kernel, stride=2, padding=2, groups=3)
+
+
+def expand(x, size):
+    # zero-stuffed upsample with the 4x kernel, same as cv.pyrUp,
+    # cropped to the (odd) parent size
+    up = F.conv_transpose2d(x, 4 * kernel, stride=2, padding=2, groups=3)
+    return up[:, :, :size[0], :size[1]]
+
+
+def build_ramp(size):
+    # 1.0 on the apple half, 0.0 on the orange half, short ramp at the seam
+    cols = size[1]
+    ramp = torch.ones(cols, device=device)
+    ramp[cols // 2:] = 0.0
+    seam = torch.linspace(1.0, 0.0, 6, device=device)[1:-1]
+    start = cols // 2 - 2
+    ramp[start:start + 4] = seam
+    return ramp.view(1, 1, 1, cols)
+
+
+def blend(A, O, levels=6):
+    a = to_tensor(A)
+    o = to_tensor(O)
+
+    # gaussian pyramids
+    gpa = [a]
+    gpo = [o]
+    for i in range(levels):
+        gpa.append(reduce(gpa[-1]))
+        gpo.append(reduce(gpo[-1]))
+
+    # laplacian pyramids
+    lpa = [gpa[levels - 1]]
+    lpo = [gpo[levels - 1]]
+    for i in range(levels - 1, 0, -1):
+        size = gpa[i - 1].shape[2:]
+        lpa.append(gpa[i - 1] - expand(gpa[i], size))
+        lpo.append(gpo[i - 1] - expand(gpo[i], size))
+
+    # blend each level against the ramp mask (broadcasts over rows/channels)
+    LS = []
+    for la, lo in zip(lpa, lpo):
+        mask = build_ramp(la.shape[2:])
+        LS.append(la * mask + lo * (1 - mask))
+
+    # reconstruct
+    ls = LS[0]
+    for i in range(1, levels):
+        ls = expand(ls, LS[i].shape[2:]) + LS[i]
+
+    # single download at the very end
+    out = ls.squeeze(0).permute(1, 2, 0).clamp(0, 255).byte().cpu().numpy()
+    return out
+
+
+if __name__ == '__main__':
+    A = cv.imread("../opencv_learning/samples/apple.jpg")
+    O = cv.imread("../opencv_learning/samples/orange.jpg")
+    assert A is not None, "check the path of the image. it exits?"
+    assert O is not None, "check the path of the image. it exits?"
+
+    A = cv.resize(A, (O.shape[1], O.shape[0]))
+
+    result = blend(A, O)
+    cv.imwrite('../opencv_learning/samples/Pyramid_blending_torch.jpg', result)